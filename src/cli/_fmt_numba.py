@@ -0,0 +1,80 @@
+# -------------------------------------------------------------
+# Formateo compilado (Numba) de lotes de RGS a bytes ASCII
+#
+# Produce exactamente las mismas líneas que ``make_rgs_printer`` en main.py:
+#     "{count:>5}: RGS=[a0, a1, ...]  (#bloques=k)\n"
+# escribiendo directamente sobre un buffer np.uint8.
+# -------------------------------------------------------------
+
+
+from __future__ import annotations
+
+import numpy as np
+
+from combinatoria._rgs_numba import njit
+
+
+_HEAD = np.frombuffer(b": RGS=[", dtype=np.uint8)
+_SEP = np.frombuffer(b", ", dtype=np.uint8)
+_MID = np.frombuffer(b"]  (#bloques=", dtype=np.uint8)
+_TAIL = np.frombuffer(b")\n", dtype=np.uint8)
+
+
+def line_bound(n: int) -> int:
+    """Cota superior de bytes por línea para RGS de longitud n."""
+    # 20 dígitos de contador + literales + hasta 3 dígitos y ", " por valor
+    return 20 + 7 + 5 * n + 13 + 3 + 2
+
+
+@njit(cache=True)
+def _put_bytes(buf, pos, src):
+    for i in range(src.shape[0]):
+        buf[pos + i] = src[i]
+    return pos + src.shape[0]
+
+
+@njit(cache=True)
+def _put_int(buf, pos, v, width):
+    """Escribe v en decimal, alineado a la derecha en ``width`` columnas."""
+    digits = 1
+    t = v
+    while t >= 10:
+        t //= 10
+        digits += 1
+    for _ in range(width - digits):
+        buf[pos] = 32
+        pos += 1
+    end = pos + digits
+    p = end - 1
+    while True:
+        buf[p] = 48 + v % 10
+        v //= 10
+        p -= 1
+        if v == 0:
+            break
+    return end
+
+
+@njit(cache=True)
+def format_rgs_batch(rows, start, buf):
+    """
+    Formatea cada fila de ``rows`` (RGS np.int8) como una línea numerada a
+    partir de ``start``. Devuelve el número de bytes escritos en ``buf``.
+    """
+    pos = 0
+    n = rows.shape[1]
+    for r in range(rows.shape[0]):
+        pos = _put_int(buf, pos, start + r, 5)
+        pos = _put_bytes(buf, pos, _HEAD)
+        k = 0
+        for i in range(n):
+            v = rows[r, i]
+            if i > 0:
+                pos = _put_bytes(buf, pos, _SEP)
+            pos = _put_int(buf, pos, v, 0)
+            if v + 1 > k:
+                k = v + 1
+        pos = _put_bytes(buf, pos, _MID)
+        pos = _put_int(buf, pos, k, 0)
+        pos = _put_bytes(buf, pos, _TAIL)
+    return pos
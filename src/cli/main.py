@@ -1,54 +1,258 @@
 from __future__ import annotations
 import argparse
+import functools
+import itertools
+import os
+import sys
 import time
-from typing import Iterable, List
-# --- después de tus imports ---
-from visual.puntos import layout_regular_ngon, draw_points, style_axes, auto_radius
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Tuple
 
 
 # Importa tus generadores (ajusta el import según tu proyecto)
 from combinatoria.rgs import (
+    count_all,
+    count_exactly,
     rgs_all,
+    rgs_all_batched,
     rgs_exactly,
     rgs_exactly_y,
     rgs_range,
-    rgs_to_blocks,
 )
 
 
-def format_rgs(a: List[int]) -> str:
-    """RGS bonito: [0,0,1,2]  + info de #bloques."""
-    k = 0 if not a else (1 + max(a))
-    return f"RGS={a}  (#bloques={k})"
+# Tabla int -> bytes para los elementos que aparecen en un bloque (0..n+1),
+# codificada una sola vez: _SIC[i] = b"i," (con la coma que sigue a cada
+# elemento). Evita str() y .encode() por cada entero impreso.
+_SIC: List[bytes] = [str(i).encode("ascii") + b"," for i in range(100)]
 
 
-def format_blocks(blocks: List[List[int]]) -> str:
-    """Bloques como {1,3} | {2,5} | {4}."""
-    parts = ["{" + ",".join(map(str, b)) + "}" for b in blocks]
-    return " | ".join(parts)
+def _ensure_str_table(n: int) -> None:
+    """Amplía ``_SIC`` para cubrir los enteros 0..n+1."""
+    for i in range(len(_SIC), n + 2):
+        _SIC.append(str(i).encode("ascii") + b",")
+
+
+def make_rgs_printer(n: int) -> Callable[[int, List[int], int], bytes]:
+    """Genera (vía ``exec``) el formateador de líneas RGS para este n.
+
+    Como n es fijo durante una ejecución, la línea completa
+    ``"{count:>5}: RGS=[a0, a1, ...]  (#bloques=k)\\n"`` se reduce a un único
+    ``bytes % tupla`` con los n índices desenrollados, sin join ni f-strings.
+    """
+    fmt = b"%5d: RGS=[" + b", ".join([b"%d"] * n) + b"]  (#bloques=%d)\n"
+    args = "".join(f"a[{i}], " for i in range(n))
+    src = f"def rgs_line(c, a, k):\n    return FMT % (c, {args}k)\n"
+    namespace = {"FMT": fmt}
+    exec(src, namespace)
+    return namespace["rgs_line"]
+
+
+def format_blocks_from_rgs(a: List[int], bufs: List[bytearray]) -> bytes:
+    """Bloques como b"{1,3} | {2,5} | {4}", directamente desde la RGS.
+
+    Recorre ``a`` una sola vez escribiendo cada elemento en el buffer de su
+    bloque; ``bufs`` lo aporta quien llama y se reutiliza (crece si hace falta).
+    """
+    sic = _SIC
+    k = 0
+    for i, v in enumerate(a, start=1):
+        if v == k:
+            # Primera aparición de la etiqueta: abre un bloque nuevo
+            if k == len(bufs):
+                bufs.append(bytearray())
+            bufs[k][:] = b"{"
+            k += 1
+        bufs[v] += sic[i]
+    for buf in bufs[:k]:
+        buf[-1] = 0x7D  # la coma final pasa a ser "}"
+    return b" | ".join(bufs[:k])
+
+
+def _write_fd(fd: int, data) -> None:
+    """``os.write`` completo: repite mientras la escritura sea parcial (pipes)."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _stdout_writer(sleep: float) -> Tuple[Callable[[bytes], object], Callable[[], object]]:
+    """Devuelve el par (write, flush) con el que se escriben los lotes en stdout.
+
+    Si stdout no es una terminal (pipe o archivo) y no hay pausa, los lotes van
+    directo al descriptor con ``os.write``: los datos son ASCII, así que no
+    hace falta pasar por ``TextIOWrapper`` ni por el buffer de ``sys.stdout``.
+    En una terminal se conserva ``sys.stdout.buffer`` (interactividad). Si
+    stdout fue sustituido por un flujo de texto sin ``buffer`` (p. ej.
+    ``io.StringIO``), los bytes se decodifican y se escriben ahí.
+    """
+    text = sys.stdout
+    text.flush()
+    buffer = getattr(text, "buffer", None)
+    if buffer is None:
+        return (lambda b: text.write(bytes(b).decode("ascii"))), text.flush
+    if sleep <= 0:
+        try:
+            fd = text.fileno()
+        except (AttributeError, OSError, ValueError):  # sin descriptor propio
+            fd = -1
+        if fd >= 0 and not os.isatty(fd):
+            buffer.flush()
+            return functools.partial(_write_fd, fd), buffer.flush
+    return buffer.write, buffer.flush
 
 
 def stream(
-    it: Iterable[List[int] | List[List[int]]],
+    it: Iterable[Tuple[List[int], int]],
     *,
-    yield_blocks: bool,
+    n: int,
+    as_blocks: bool,
     limit: int | None,
     sleep: float,
+    batch_size: int = 4096,
 ) -> None:
-    """Imprime en vivo (opcionalmente con pausa entre líneas)."""
+    """Imprime en vivo (opcionalmente con pausa entre líneas).
+
+    ``it`` produce pares (RGS, k) (generadores con ``with_k=True``) de
+    longitud n; con ``as_blocks`` se imprimen como bloques. Las líneas
+    se acumulan y se escriben en lotes de ``batch_size`` con una sola escritura
+    (ver ``_stdout_writer``). Con ``sleep > 0`` se escribe (y se vacía)
+    línea a línea para conservar la interactividad.
+    """
+    if limit is not None and limit <= 0:
+        return
+    rgs_line = make_rgs_printer(n)
+    bufs: List[bytearray] = []
+    write, flush = _stdout_writer(sleep)
+    if sleep > 0:
+        batch_size = 1
+    elif limit is not None:
+        batch_size = max(1, min(batch_size, limit))
+
+    lines: List[bytes] = []
     count = 0
-    for obj in it:
+    for a, k in it:
         count += 1
-        if yield_blocks:
-            print(f"{count:>5}: {format_blocks(obj)}")  # type: ignore[arg-type]
+        if as_blocks:
+            lines.append(b"%5d: %b\n" % (count, format_blocks_from_rgs(a, bufs)))
         else:
-            print(f"{count:>5}: {format_rgs(obj)}")     # type: ignore[arg-type]
+            lines.append(rgs_line(count, a, k))
+        if len(lines) >= batch_size:
+            write(b"".join(lines))
+            lines.clear()
+            if sleep > 0:
+                flush()
         if limit is not None and count >= limit:
             break
         if sleep > 0:
             time.sleep(sleep)
 
+    if lines:
+        write(b"".join(lines))
+    flush()
+
+
+# n mínimo para el camino por lotes: por debajo, importar numpy/numba cuesta
+# más (≈0.5 s) que enumerar Bell(n) en Python puro.
+_BATCHED_MIN_N = 11
+
+
+def _have_numba() -> bool:
+    try:
+        from combinatoria._rgs_numba import HAVE_NUMBA
+    except ImportError:  # numpy no disponible
+        return False
+    return HAVE_NUMBA
+
+
+def stream_all_batched(n: int, *, limit: int | None, batch_size: int = 65536) -> None:
+    """Versión por lotes de ``stream`` para ``--all`` sin ``--blocks`` ni pausa.
+
+    Consume las matrices np.int8 de ``rgs_all_batched`` y las formatea a bytes
+    en bloque con el núcleo Numba ``format_rgs_batch``.
+    """
+    # Import diferido: numpy/numba solo se cargan en este camino
+    import numpy as np
+    from cli._fmt_numba import format_rgs_batch, line_bound
+
+    if limit is not None and limit <= 0:
+        return
+    if limit is not None:
+        batch_size = max(1, min(batch_size, limit))
+
+    text = np.empty(batch_size * line_bound(n), dtype=np.uint8)
+    write, flush = _stdout_writer(0.0)
+    count = 0
+    for rows in rgs_all_batched(n, batch_size):
+        if limit is not None:
+            rows = rows[: limit - count]
+        nbytes = format_rgs_batch(rows, count + 1, text)
+        write(memoryview(text)[:nbytes])
+        count += rows.shape[0]
+        if limit is not None and count >= limit:
+            break
+    flush()
+
+
+def _emit_exactly(n: int, k: int, start: int, limit: int | None, as_blocks: bool) -> bytes:
+    """Tarea de un proceso de ``stream_parallel``: todas las líneas con k bloques.
+
+    Numera desde ``start + 1`` y emite a lo sumo ``limit`` líneas; devuelve el
+    bloque de bytes completo para que el proceso padre lo escriba en orden.
+    """
+    _ensure_str_table(n)
+    rgs_line = make_rgs_printer(n)
+    bufs: List[bytearray] = []
+    lines: List[bytes] = []
+    count = start
+    for a, kk in itertools.islice(rgs_exactly(n, k, with_k=True), limit):
+        count += 1
+        if as_blocks:
+            lines.append(b"%5d: %b\n" % (count, format_blocks_from_rgs(a, bufs)))
+        else:
+            lines.append(rgs_line(count, a, kk))
+    return b"".join(lines)
+
+
+def stream_parallel(
+    n: int,
+    kmin: int,
+    kmax: int,
+    *,
+    as_blocks: bool,
+    limit: int | None,
+    workers: int,
+) -> None:
+    """Enumera cada k de [kmin, kmax] en un proceso distinto (``rgs_exactly``).
+
+    La salida queda agrupada por k (no en el orden lexicográfico de
+    ``rgs_range``); la numeración es global porque el desplazamiento de cada
+    k se conoce de antemano: la suma de S(n, j) para j < k.
+    """
+    if limit is not None and limit <= 0:
+        return
+    tasks = []
+    offset = 0
+    for k in range(kmin, kmax + 1):
+        total = count_exactly(n, k)
+        if limit is not None:
+            if offset >= limit:
+                break
+            total = min(total, limit - offset)
+        if total > 0:
+            tasks.append((n, k, offset, total, as_blocks))
+        offset += total
+    if not tasks:
+        return
+
+    write, flush = _stdout_writer(0.0)
+    max_workers = min(len(tasks), workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # map conserva el orden de las tareas: se escribe en orden de k
+        for blob in pool.map(_emit_exactly, *zip(*tasks)):
+            write(blob)
+    flush()
+
 
 def main() -> None:
     p = argparse.ArgumentParser(
@@ -56,8 +260,8 @@ def main() -> None:
     )
     p.add_argument("--n", type=int, required=True, help="Tamaño del conjunto {1..n}.")
     mode = p.add_mutually_exclusive_group(required=True)
-    mode.add_argument("--all", action="store_true", help="Algoritmo V (todas las particiones).")
-    mode.add_argument("--exact", type=int, metavar="K", help="Algoritmo X (exactamente K bloques).")
+    mode.add_argument("--all", action="store_true", help="Djokić (todas las particiones).")
+    mode.add_argument("--exact", type=int, metavar="K", help="Djokić con poda (exactamente K bloques).")
     mode.add_argument("--exact-y", type=int, metavar="K", help="Algoritmo Y (exactamente K bloques).")
     mode.add_argument("--range", nargs=2, type=int, metavar=("KMIN", "KMAX"),
                       help="Algoritmo Z (K en [KMIN,KMAX]).")
@@ -65,18 +269,33 @@ def main() -> None:
     p.add_argument("--blocks", action="store_true",
                    help="Imprimir como bloques en lugar de RGS.")
     p.add_argument("--limit", type=int, default=None,
-                   help="Número máximo de líneas a imprimir (para pruebas).")
+                   help="Número máximo de líneas a imprimir (para pruebas; <= 0 no imprime nada).")
     p.add_argument("--sleep", type=float, default=0.0,
                    help="Segundos de pausa entre líneas (p. ej. 0.1).")
+    p.add_argument("--workers", type=int, default=1,
+                   help="Procesos para --all/--range: cada K se enumera aparte y la salida "
+                        "queda agrupada por K (0 = todos los núcleos; por defecto 1). "
+                        "No aplica a --exact/--exact-y; con --sleep se ignora.")
+    p.add_argument("--count-only", action="store_true",
+                   help="Solo imprime cuántas particiones hay (Bell/Stirling), sin enumerarlas.")
     mode.add_argument("--points-only", action="store_true",
                   help="Dibuja los puntos en un polígono regular sin particiones.")
 
     args = p.parse_args()
+    if args.workers < 0:
+        p.error("--workers debe ser >= 0")
+    if args.workers != 1 and (args.exact is not None or args.exact_y is not None):
+        p.error("--workers solo aplica a --all y --range")
+    _ensure_str_table(args.n)
 
     # -------------------------------------------------------
     # NUEVO MODO: solo mostrar los puntos (sin particiones)
     # -------------------------------------------------------
     if args.points_only:
+        # Import diferido: matplotlib solo hace falta en este modo
+        import matplotlib.pyplot as plt
+        from visual.puntos import layout_regular_ngon, draw_points, style_axes, auto_radius
+
         n = args.n
         radius = auto_radius(n)
         positions = layout_regular_ngon(n, radius=radius, rotation_deg=90)
@@ -89,22 +308,52 @@ def main() -> None:
         return
 
 
+    # Solo conteo: forma cerrada, sin enumerar
+    if args.count_only:
+        if args.all:
+            total = count_all(args.n)
+        elif args.exact is not None:
+            total = count_exactly(args.n, args.exact)
+        elif args.exact_y is not None:
+            total = count_exactly(args.n, args.exact_y)
+        else:
+            kmin, kmax = args.range
+            total = 0
+            if 0 <= kmin <= kmax <= args.n:
+                total = sum(count_exactly(args.n, k) for k in range(kmin, kmax + 1))
+        print(total)
+        return
+
+    # Un proceso por número de bloques (opcional; cambia el orden de salida)
+    if args.workers != 1 and args.sleep <= 0 and (args.all or args.range is not None):
+        kmin, kmax = (0, args.n) if args.all else args.range
+        if 0 <= kmin <= kmax <= args.n:
+            stream_parallel(args.n, kmin, kmax, as_blocks=args.blocks,
+                            limit=args.limit, workers=args.workers)
+        return
+
+    # Camino por lotes (Numba + NumPy) para el caso más voluminoso
+    if (args.all and not args.blocks and args.sleep <= 0
+            and args.n >= _BATCHED_MIN_N and _have_numba()):
+        stream_all_batched(args.n, limit=args.limit)
+        return
+
     # Selección del iterador
     if args.all:
-        it = rgs_all(args.n, yield_blocks=args.blocks)
+        it = rgs_all(args.n, with_k=True)
     elif args.exact is not None:
-        it = rgs_exactly(args.n, args.exact, yield_blocks=args.blocks)
+        it = rgs_exactly(args.n, args.exact, with_k=True)
     elif args.exact_y is not None:
-        it = rgs_exactly_y(args.n, args.exact_y, yield_blocks=args.blocks)
+        it = rgs_exactly_y(args.n, args.exact_y, with_k=True)
     elif args.range is not None:
         kmin, kmax = args.range
-        it = rgs_range(args.n, kmin, kmax, yield_blocks=args.blocks)
+        it = rgs_range(args.n, kmin, kmax, with_k=True)
     else:
         p.error("Debes elegir un modo: --all | --exact K | --exact-y K | --range KMIN KMAX")
         return
 
     # Stream en vivo
-    stream(it, yield_blocks=args.blocks, limit=args.limit, sleep=args.sleep)
+    stream(it, n=args.n, as_blocks=args.blocks, limit=args.limit, sleep=args.sleep)
 
 
 if __name__ == "__main__":
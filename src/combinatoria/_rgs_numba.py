@@ -0,0 +1,75 @@
+# -------------------------------------------------------------
+# Núcleo compilado (Numba) para enumerar RGS por lotes
+#
+# Implementa el Algoritmo H de Knuth (TAOCP 7.2.1.5) de forma iterativa
+# sobre arreglos np.int8, escribiendo cada RGS como una fila de ``out``.
+# Numba es opcional: sin él, el mismo código corre en Python puro.
+# -------------------------------------------------------------
+
+
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depende del entorno
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Sustituto de ``numba.njit`` cuando Numba no está instalado."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+def new_state(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Crea el estado inicial (a, b) del Algoritmo H para RGS de longitud n>=1.
+    a es la RGS actual (todo ceros) y b[j] = 1 + max(a[0..j-1]), con b[0] = 0.
+    """
+    a = np.zeros(n, dtype=np.int8)
+    b = np.ones(n, dtype=np.int8)
+    b[0] = 0
+    return a, b
+
+
+@njit(cache=True)
+def rgs_all_batch(n, a, b, out):
+    """
+    Emite en las filas de ``out`` las RGS siguientes a partir del estado (a, b)
+    y devuelve cuántas filas escribió. El estado queda listo para la siguiente
+    llamada; al agotarse la enumeración se marca con a[0] = -1.
+    """
+    rows = out.shape[0]
+    if a[0] < 0:
+        return 0
+    count = 0
+    while count < rows:
+        # H2: visitar
+        for i in range(n):
+            out[count, i] = a[i]
+        count += 1
+
+        # H3: incrementar la última posición si se puede
+        if a[n - 1] < b[n - 1]:
+            a[n - 1] += 1
+            continue
+
+        # H4: buscar la posición j más a la derecha con a[j] < b[j]
+        j = n - 2
+        while j > 0 and a[j] == b[j]:
+            j -= 1
+        if j <= 0:
+            a[0] = -1
+            return count
+
+        # H5: incrementar a[j] y reiniciar el sufijo
+        a[j] += 1
+        m = b[j] + 1 if a[j] == b[j] else b[j]
+        for i in range(j + 1, n):
+            a[i] = 0
+            b[i] = m
+    return count
@@ -8,12 +8,18 @@
 # Repositorio: https://github.com/gstamatelat/partitions-enumeration
 # 
 # Algoritmos originales: V, W, X, Y, Z (originalmente implementados en C++)
+# rgs_all y rgs_exactly usan el esquema iterativo de Djokić et al. (1989),
+# "A fast iterative algorithm for generating set partitions".
 # Licencia y información de cita: ver CITATION.cff en la raíz del proyecto.
 # -------------------------------------------------------------
 
 
 from __future__ import annotations
-from typing import Dict, Iterator, List, Tuple
+from math import comb
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 # -------------------------------------------------------------
@@ -26,117 +32,215 @@ def rgs_to_blocks(a: List[int]) -> List[List[int]]:
     Devuelve una lista de bloques (cada bloque es lista de ints 1-based).
     El orden de bloques será por el primer índice donde aparece cada etiqueta.
     """
-    groups: Dict[int, List[int]] = {}
+    return rgs_to_blocks_into(a, [])
+
+
+def rgs_to_blocks_into(a: List[int], buffers: List[List[int]]) -> List[List[int]]:
+    """
+    Igual que rgs_to_blocks, pero escribe los bloques en listas que aporta
+    quien llama y que se reutilizan entre llamadas (se vacían y, si faltan,
+    se agregan). Devuelve buffers[:k]; son válidas hasta la siguiente llamada.
+    """
+    k = 0
     for i, label in enumerate(a, start=1):  # i es el elemento 1..n
-        groups.setdefault(label, []).append(i)
-    # Orden natural por etiqueta RGS (0,1,2,...) ya respeta orden de creación
-    return [groups[k] for k in sorted(groups.keys())]
+        if label == k:
+            # En una RGS cada etiqueta nueva es exactamente la siguiente (0,1,2,...)
+            if k == len(buffers):
+                buffers.append([])
+            else:
+                buffers[k].clear()
+            k += 1
+        buffers[label].append(i)
+    return buffers[:k]
 
 
 # -------------------------------------------------------------
-# Algoritmo V — Todas las particiones (sin restricción de k)
+# Conteo sin enumerar (Bell / Stirling de 2a especie)
 # -------------------------------------------------------------
 
-def _next_V(a: List[int], b: List[int], n: int) -> bool:
+def count_all(n: int) -> int:
+    """
+    Número de particiones de {1..n} (número de Bell), sin enumerarlas.
+    Recurrencia B_{m+1} = sum_{k=0..m} C(m,k) B_k con B_0 = 1; O(n^2).
+    """
+    if n < 0:
+        raise ValueError("n debe ser >= 0")
+    B = [1]
+    for m in range(n):
+        B.append(sum(comb(m, k) * B[k] for k in range(m + 1)))
+    return B[n]
+
+
+def count_exactly(n: int, k: int) -> int:
+    """
+    Número de particiones de {1..n} con exactamente k bloques (Stirling S(n,k)).
+    DP S(i,j) = j S(i-1,j) + S(i-1,j-1) sobre una sola fila; O(n k).
+    """
+    if not (0 <= k <= n):
+        return 0
+    # S[j] = S(i, j) para la fila i actual; fila 0: S(0,0) = 1
+    S = [1] + [0] * k
+    for i in range(1, n + 1):
+        for j in range(min(i, k), 0, -1):
+            S[j] = j * S[j] + S[j - 1]
+        S[0] = 0
+    return S[k]
+
+
+# -------------------------------------------------------------
+# Djokić et al. (1989) — Todas las particiones (sin restricción de k)
+# -------------------------------------------------------------
+
+def _next_D(a: List[int], m: List[int], n: int) -> bool:
     """
     Avanza a la siguiente RGS en orden lexicográfico para 'todas las particiones'.
     Devuelve False si ya no hay siguiente.
-    Traducción directa del 'next' del Algoritmo V (C++).
+    Esquema iterativo de Djokić et al. (1989): junto a 'a' se mantiene
+    m[i] = 1 + max(a[0..i]), así a[i] admite incremento si a[i] < m[i-1]
+    y el sufijo se reinicia sin recalcular ningún máximo.
     """
-    c = n - 1
-    # Evita IndexError cuando c baja a 0
-    while True:
-        if c == 0:
-            return False
-        if not (a[c] == n - 1 or a[c] > b[c]):
-            break
-        c -= 1
+    i = n - 1
+    while i > 0 and a[i] == m[i - 1]:
+        i -= 1
+    if i == 0:
+        return False
 
-    a[c] += 1
-    for i in range(c + 1, n):
-        a[i] = 0
-        b[i] = max(a[i - 1], b[i - 1])
+    a[i] += 1
+    mi = a[i] + 1 if a[i] == m[i - 1] else m[i - 1]
+    m[i] = mi
+    for j in range(i + 1, n):
+        a[j] = 0
+        m[j] = mi
     return True
 
-def rgs_all(n: int, *, yield_blocks: bool = False) -> Iterator[List[int] | List[List[int]]]:
+def rgs_all(n: int, *, yield_blocks: bool = False,
+            with_k: bool = False) -> Iterator[List[int] | List[List[int]] | Tuple[List, int]]:
     """
-    Genera todas las RGS de longitud n (particiones de {1..n}) usando Algoritmo V.
+    Genera todas las RGS de longitud n (particiones de {1..n}) con el esquema de Djokić.
     Si yield_blocks=True, devuelve la partición como lista de bloques (1-based).
+    Si with_k=True, emite pares (partición, k) con k = número de bloques, que el
+    generador ya conoce (evita recalcular 1 + max(a)).
     """
     if n < 0:
         raise ValueError("n debe ser >= 0")
     if n == 0:
         # Por convenio, una partición vacía: [[]] o RGS vacía.
-        yield [] if not yield_blocks else []
+        yield ([], 0) if with_k else []
         return
 
     a = [0] * n
-    b = [0] * n
+    m = [1] * n
     # Emitir estado inicial
-    yield rgs_to_blocks(a) if yield_blocks else list(a)
+    obj = rgs_to_blocks(a) if yield_blocks else list(a)
+    yield (obj, m[n - 1]) if with_k else obj
     # Iterar hasta agotar
-    while _next_V(a, b, n):
-        yield rgs_to_blocks(a) if yield_blocks else list(a)
+    while _next_D(a, m, n):
+        obj = rgs_to_blocks(a) if yield_blocks else list(a)
+        yield (obj, m[n - 1]) if with_k else obj
+
+
+def rgs_all_batched(n: int, batch: int = 8192) -> Iterator["np.ndarray"]:
+    """
+    Genera todas las RGS de longitud n por lotes: cada elemento es una matriz
+    np.int8 de forma (filas, n), con filas <= batch, en el mismo orden que rgs_all.
+    Usa el núcleo Numba de _rgs_numba (Python puro si Numba no está instalado).
+    """
+    # Import diferido: numpy/numba solo se cargan si se usa esta vía
+    import numpy as np
+    from combinatoria._rgs_numba import new_state, rgs_all_batch
+
+    if n < 0:
+        raise ValueError("n debe ser >= 0")
+    if n == 0:
+        yield np.zeros((1, 0), dtype=np.int8)
+        return
+
+    a, b = new_state(n)
+    while True:
+        out = np.empty((batch, n), dtype=np.int8)
+        got = rgs_all_batch(n, a, b, out)
+        if got == 0:
+            return
+        yield out[:got]
+        if got < batch:
+            return
 
 
 # -------------------------------------------------------------
-# Algoritmo X — Exactamente k bloques
+# Djokić et al. (1989) — Exactamente k bloques (con poda)
 # -------------------------------------------------------------
 
-def _first_X(a: List[int], b: List[int], n: int, k: int) -> None:
+def _first_D_exact(a: List[int], m: List[int], n: int, k: int) -> None:
     """
-    Inicializa el estado (a, b) para enumerar particiones con exactamente k bloques (Algoritmo X).
-    Traducción directa de la rutina 'first' del C++.
+    Inicializa (a, m) con la menor RGS de exactamente k bloques:
+    ceros seguidos de 1, 2, ..., k-1 en las últimas posiciones.
     """
-    # for (int i = n - 1; i > n - k; i--)
-    #   a[i] = k - n + i;
-    #   b[i] = k - n + i - 1;
-    for i in range(n - 1, n - k, -1):
-        a[i] = k - n + i
-        b[i] = k - n + i - 1
+    for i in range(n):
+        a[i] = max(0, i - (n - k))
+        m[i] = a[i] + 1
 
 
-def _next_X(a: List[int], b: List[int], n: int, k: int) -> bool:
+def _next_D_exact(a: List[int], m: List[int], n: int, k: int) -> bool:
     """
-    Avanza a la siguiente RGS con exactamente k bloques (Algoritmo X).
+    Avanza a la siguiente RGS con exactamente k bloques.
     Devuelve False si ya no hay siguiente.
+    Igual que _next_D, pero poda los incrementos tras los cuales el sufijo
+    ya no alcanza para abrir los k - m[i] bloques que faltan; el sufijo se
+    rellena con la menor completación posible (ceros y luego m[i]..k-1).
     """
-    while True:
-        c = n - 1
-        while a[c] == k - 1 or a[c] > b[c]:
-            c -= 1
-            if c == 0:
-                return False
-        a[c] += 1
-        for i in range(c + 1, n):
-            a[i] = 0
-            b[i] = max(a[i - 1], b[i - 1])
-        m = max(a[n - 1], b[n - 1])
-        if m == k - 1:
-            return True
-
-
-def rgs_exactly(n: int, k: int, *, yield_blocks: bool = False) -> Iterator[List[int] | List[List[int]]]:
-    """
-    Genera las RGS (particiones de {1..n}) con exactamente k bloques (Algoritmo X).
+    i = n - 1
+    while i > 0:
+        v = a[i] + 1
+        if v <= m[i - 1] and v < k:
+            mi = v + 1 if v == m[i - 1] else m[i - 1]
+            if n - 1 - i >= k - mi:
+                break
+        i -= 1
+    if i == 0:
+        return False
+
+    a[i] = v
+    m[i] = mi
+    j = i + 1
+    for _ in range(n - 1 - i - (k - mi)):
+        a[j] = 0
+        m[j] = mi
+        j += 1
+    for label in range(mi, k):
+        a[j] = label
+        m[j] = label + 1
+        j += 1
+    return True
+
+
+def rgs_exactly(n: int, k: int, *, yield_blocks: bool = False,
+                with_k: bool = False) -> Iterator[List[int] | List[List[int]] | Tuple[List, int]]:
+    """
+    Genera las RGS (particiones de {1..n}) con exactamente k bloques (Djokić con poda).
     Si yield_blocks=True, devuelve la partición como lista de bloques (1-based).
+    Si with_k=True, emite pares (partición, k) con k = número de bloques, que el
+    generador ya conoce (evita recalcular 1 + max(a)).
     """
     if not (0 <= k <= n):
         return
     if n == 0:
         if k == 0:
-            yield [] if not yield_blocks else []
+            yield ([], 0) if with_k else []
+        return
+    if k == 0:
         return
 
     a = [0] * n
-    b = [0] * n
-    _first_X(a, b, n, k)
+    m = [0] * n
+    _first_D_exact(a, m, n, k)
 
     # Emitir estado inicial
-    yield rgs_to_blocks(a) if yield_blocks else list(a)
+    obj = rgs_to_blocks(a) if yield_blocks else list(a)
+    yield (obj, k) if with_k else obj
     # Iterar
-    while _next_X(a, b, n, k):
-        yield rgs_to_blocks(a) if yield_blocks else list(a)
+    while _next_D_exact(a, m, n, k):
+        obj = rgs_to_blocks(a) if yield_blocks else list(a)
+        yield (obj, k) if with_k else obj
 
 
 # -------------------------------------------------------------
@@ -188,25 +292,32 @@ def _next_Y(a: List[int], b: List[int], n: int, k: int) -> bool:
     return True
 
 
-def rgs_exactly_y(n: int, k: int, *, yield_blocks: bool = False) -> Iterator[List[int] | List[List[int]]]:
+def rgs_exactly_y(n: int, k: int, *, yield_blocks: bool = False,
+                  with_k: bool = False) -> Iterator[List[int] | List[List[int]] | Tuple[List, int]]:
     """
     Genera las RGS (particiones) con exactamente k bloques usando la variante Y.
     Si yield_blocks=True, devuelve la partición como lista de bloques (1-based).
+    Si with_k=True, emite pares (partición, k) con k = número de bloques, que el
+    generador ya conoce (evita recalcular 1 + max(a)).
     """
     if not (0 <= k <= n):
         return
     if n == 0:
         if k == 0:
-            yield [] if not yield_blocks else []
+            yield ([], 0) if with_k else []
+        return
+    if k == 0:
         return
 
     a = [0] * n
     b = [0] * n
     _first_Y(a, b, n, k)
 
-    yield rgs_to_blocks(a) if yield_blocks else list(a)
+    obj = rgs_to_blocks(a) if yield_blocks else list(a)
+    yield (obj, k) if with_k else obj
     while _next_Y(a, b, n, k):
-        yield rgs_to_blocks(a) if yield_blocks else list(a)
+        obj = rgs_to_blocks(a) if yield_blocks else list(a)
+        yield (obj, k) if with_k else obj
 
 
 # -------------------------------------------------------------
@@ -263,10 +374,13 @@ def _next_Z(a: List[int], b: List[int], n: int, kmin: int, kmax: int) -> bool:
     return True
 
 
-def rgs_range(n: int, kmin: int, kmax: int, *, yield_blocks: bool = False) -> Iterator[List[int] | List[List[int]]]:
+def rgs_range(n: int, kmin: int, kmax: int, *, yield_blocks: bool = False,
+              with_k: bool = False) -> Iterator[List[int] | List[List[int]] | Tuple[List, int]]:
     """
     Genera RGS (particiones de {1..n}) cuyo número de bloques está en [kmin, kmax].
     Si yield_blocks=True, devuelve la partición como lista de bloques (1-based).
+    Si with_k=True, emite pares (partición, k) con k = número de bloques, que el
+    generador ya conoce (evita recalcular 1 + max(a)).
     """
     if n < 0:
         raise ValueError("n debe ser >= 0")
@@ -274,7 +388,7 @@ def rgs_range(n: int, kmin: int, kmax: int, *, yield_blocks: bool = False) -> It
         return
     if n == 0:
         if kmin == 0 <= kmax:
-            yield [] if not yield_blocks else []
+            yield ([], 0) if with_k else []
         return
 
     a = [0] * n
@@ -284,7 +398,9 @@ def rgs_range(n: int, kmin: int, kmax: int, *, yield_blocks: bool = False) -> It
 
     # Emitir estado inicial: asegurar que el máximo esté en rango
     # (la inicialización Z coloca exactamente kmin bloques)
-    yield rgs_to_blocks(a) if yield_blocks else list(a)
+    obj = rgs_to_blocks(a) if yield_blocks else list(a)
+    yield (obj, max(kmin, 1)) if with_k else obj
 
     while _next_Z(a, b, n, kmin, kmax):
-        yield rgs_to_blocks(a) if yield_blocks else list(a)
+        obj = rgs_to_blocks(a) if yield_blocks else list(a)
+        yield (obj, b[n] + 1) if with_k else obj
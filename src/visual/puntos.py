@@ -12,8 +12,8 @@ Funciones principales:
 """
 
 import math
-from typing import List, Sequence, Tuple
-import matplotlib.pyplot as plt
+from typing import Tuple
+import numpy as np
 
 __all__ = ["layout_regular_ngon", "auto_radius", "style_axes", "draw_points"]
 
@@ -21,8 +21,7 @@ __all__ = ["layout_regular_ngon", "auto_radius", "style_axes", "draw_points"]
 Point = Tuple[float, float]
 
 
-def _rotation_rad(deg: float) -> float:
-    return deg * math.pi / 180.0
+_DEG2RAD = math.pi / 180.0
 
 
 def layout_regular_ngon(
@@ -31,7 +30,7 @@ def layout_regular_ngon(
     center: Point = (0.0, 0.0),
     radius: float = 1.0,
     rotation_deg: float = 90.0,
-) -> List[Point]:
+) -> np.ndarray:
     """Devuelve las coordenadas (x,y) de n puntos en un polígono regular.
 
     Reglas:
@@ -47,27 +46,20 @@ def layout_regular_ngon(
         rotation_deg: rotación inicial en grados (CCW). 90 coloca el 1 arriba.
 
     Returns:
-        Lista de tuplas (x, y) en orden antihorario.
+        Arreglo ``(n, 2)`` de float64 con las filas (x, y) en orden antihorario.
     """
     if n <= 0:
         raise ValueError("n debe ser >= 1")
 
     cx, cy = center
     if n == 1:
-        return [(cx, cy)]
+        return np.array([[cx, cy]], dtype=np.float64)
     if n == 2:
         # Dos puntos simétricos en el eje X alrededor del centro
-        return [(cx - radius, cy), (cx + radius, cy)]
+        return np.array([[cx - radius, cy], [cx + radius, cy]], dtype=np.float64)
 
-    rot = _rotation_rad(rotation_deg)
-    step = 2.0 * math.pi / n
-    pts: List[Point] = []
-    for i in range(n):
-        ang = rot + i * step
-        x = cx + radius * math.cos(ang)
-        y = cy + radius * math.sin(ang)
-        pts.append((x, y))
-    return pts
+    angles = rotation_deg * _DEG2RAD + np.arange(n, dtype=np.float64) * (2.0 * np.pi / n)
+    return np.column_stack([cx + radius * np.cos(angles), cy + radius * np.sin(angles)])
 
 
 def auto_radius(
@@ -118,6 +110,7 @@ def draw_points(
     positions,
     *,
     labels: bool = True,
+    markers: bool = True,
     indices_start: int = 1,
     point_size: float = 40.0,
     label_size: float = 11.0,
@@ -126,21 +119,34 @@ def draw_points(
     label_offset_factor: float = 0.08,
     center: tuple[float, float] = (0.0, 0.0),
 ) -> dict:
-    """Dibuja puntos y, opcionalmente, etiquetas desplazadas radialmente."""
-    xs = [p[0] for p in positions]
-    ys = [p[1] for p in positions]
-    sc = ax.scatter(xs, ys, s=point_size, zorder=3, c=point_color)
+    """Dibuja puntos y, opcionalmente, etiquetas desplazadas radialmente.
+
+    ``positions`` es un arreglo ``(n, 2)`` (o cualquier secuencia de pares x, y).
+    Todos los puntos comparten estilo, así que se dibujan como un único
+    ``Line2D`` con marcador (más liviano que el ``PathCollection`` de scatter);
+    ``point_size`` conserva la escala de scatter (área en pt²). Con
+    ``markers=False`` solo se dibujan las etiquetas y ``"points"`` es None
+    (para quien gestiona su propio artista de puntos, p. ej. ``SimApp``).
+    """
+    pts = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    line = None
+    if markers:
+        (line,) = ax.plot(
+            pts[:, 0], pts[:, 1],
+            linestyle="None", marker="o", markersize=math.sqrt(point_size),
+            color=point_color, zorder=3,
+        )
 
     texts = []
     if labels:
         cx, cy = center
-        if positions:
-            r0 = math.hypot(positions[0][0] - cx, positions[0][1] - cy)
+        if len(pts):
+            r0 = math.hypot(pts[0, 0] - cx, pts[0, 1] - cy)
         else:
             r0 = 1.0
         dr = label_offset_factor * max(r0, 1e-6)
 
-        for i, (x, y) in enumerate(positions, start=indices_start):
+        for i, (x, y) in enumerate(pts.tolist(), start=indices_start):
             vx, vy = x - cx, y - cy
             norm = math.hypot(vx, vy) or 1.0
             ux, uy = vx / norm, vy / norm
@@ -152,5 +158,4 @@ def draw_points(
             )
             texts.append(t)
 
-    return {"scatter": sc, "texts": texts}
-
+    return {"points": line, "texts": texts}
@@ -19,19 +19,22 @@ Más adelante se integrará el dibujado de bloques por partición.
 import argparse
 import tkinter as tk
 from tkinter import scrolledtext
-import time
 from typing import List
 
 import matplotlib
-matplotlib.use("TkAgg")  # backend para integrar con Tkinter
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-from combinatoria.rgs import rgs_all, rgs_to_blocks
+from combinatoria.rgs import rgs_all, rgs_to_blocks_into
 from visual.puntos import layout_regular_ngon, draw_points, style_axes, auto_radius
 
 
 class SimApp(tk.Tk):
+    # Líneas por inserción cuando no hay pausa y máximo de líneas retenidas
+    BATCH = 500
+    MAX_LINES = 5000
+
     def __init__(self, n: int, sleep: float, dark: bool,
                  rotation: float, point_size: float, label_offset: float) -> None:
         super().__init__()
@@ -50,15 +53,24 @@ class SimApp(tk.Tk):
         # puntos
         radius = auto_radius(n)
         self.positions = layout_regular_ngon(n, radius=radius, rotation_deg=rotation)
-        draw_points(
+        # Un único artista de puntos, creado una vez y mutado por partición
+        # (show_partition) en lugar de redibujar los puntos en cada paso.
+        self._sc = self.ax.scatter(
+            self.positions[:, 0], self.positions[:, 1],
+            s=point_size, c=("white" if dark else "black"), zorder=3,
+        )
+        self._texts = draw_points(
             self.ax,
             self.positions,
             labels=True,
-            point_size=point_size,
+            markers=False,
             label_offset_factor=label_offset,
-            point_color=("white" if dark else "black"),
             label_color=("white" if dark else "black"),
-        )
+        )["texts"]
+        # Un color distinto por etiqueta de bloque (0..n-1): tab10 alcanza
+        # hasta 10 bloques; para más se muestrean n colores de un mapa continuo
+        cmap = matplotlib.colormaps["tab10" if n <= 10 else "turbo"].resampled(max(n, 1))
+        self._palette = cmap(np.arange(n))
         self.ax.set_title(f"{n} puntos — polígono regular", color=("white" if dark else "black"))
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
@@ -87,21 +99,65 @@ class SimApp(tk.Tk):
 
     def stream_partitions(self) -> None:
         """Recorre todas las particiones y las imprime en el panel derecho.
-        (Por ahora, no actualiza el dibujo por partición; solo la lista textual.)
-        """
-        counter = 0
-        for blocks in rgs_all(self.n, yield_blocks=True):
-            counter += 1
-            text = f"{counter:>5}: " + " | ".join("{" + ",".join(map(str, b)) + "}" for b in blocks)
-            self.panel.insert(tk.END, text + "\n")
-            self.panel.see(tk.END)  # autoscroll
-            self.update()            # refresca UI
-            if self.sleep > 0:
-                time.sleep(self.sleep)
+        Por ahora NO dibuja bloques: los puntos conservan su color; el
+        coloreado por partición queda disponible en ``show_partition``.
 
-        # Al terminar, enfoca el final
-        self.panel.insert(tk.END, "\nFin del listado.\n")
-        self.panel.see(tk.END)
+        Solo prepara el iterador; el trabajo lo hace ``_step`` por lotes desde
+        el mainloop. El panel conserva solo las últimas ``MAX_LINES`` líneas.
+        """
+        self._iter = iter(rgs_all(self.n))
+        # Listas de bloques reutilizadas en cada partición (rgs_to_blocks_into)
+        self._buffers: List[List[int]] = [[] for _ in range(self.n)]
+        self._counter = 0
+        self._lines = 0
+        self.after(0, self._step)
+
+    def _step(self) -> None:
+        """Procesa un lote de particiones y se reprograma.
+
+        Sin pausa consume hasta ``BATCH`` particiones y vuelve con
+        ``after_idle`` (cuando Tk ya atendió sus eventos); con pausa emite una
+        línea y vuelve con ``after(sleep)``, sin bloquear con ``time.sleep``.
+        """
+        batch = 1 if self.sleep > 0 else self.BATCH
+        pending: List[str] = []
+        for a in self._iter:
+            blocks = rgs_to_blocks_into(a, self._buffers)
+            self._counter += 1
+            pending.append(f"{self._counter:>5}: "
+                           + " | ".join("{" + ",".join(map(str, b)) + "}" for b in blocks)
+                           + "\n")
+            if len(pending) >= batch:
+                break
+
+        if not pending:
+            # Al terminar, enfoca el final
+            self.panel.insert(tk.END, "\nFin del listado.\n")
+            self.panel.see(tk.END)
+            return
+
+        self.panel.insert(tk.END, "".join(pending))
+        self._lines += len(pending)
+        if self._lines > self.MAX_LINES:
+            # Descarta las líneas más antiguas (memoria acotada)
+            extra = self._lines - self.MAX_LINES
+            self.panel.delete("1.0", f"{extra + 1}.0")
+            self._lines = self.MAX_LINES
+        self.panel.see(tk.END)  # autoscroll
+        self.update_idletasks()
+
+        if self.sleep > 0:
+            self.after(int(self.sleep * 1000), self._step)
+        else:
+            self.after_idle(self._step)
+
+    def show_partition(self, a: List[int]) -> None:
+        """Colorea cada punto según su bloque en la RGS ``a`` (mismo artista).
+
+        Gancho para el futuro dibujado por partición; ``_step`` no lo invoca.
+        """
+        self._sc.set_facecolors(self._palette[np.asarray(a, dtype=np.intp)])
+        self.canvas.draw_idle()
 
 
 def main() -> None:
@@ -126,4 +182,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    matplotlib.use("TkAgg")  # backend para integrar con Tkinter
     main()
@@ -0,0 +1,120 @@
+# tests/test_cli.py
+import io
+import sys
+
+import pytest
+
+from cli.main import main
+
+
+def run_cli(monkeypatch, capsys, *args: str) -> list:
+    monkeypatch.setattr(sys, "argv", ["main", *args])
+    main()
+    return capsys.readouterr().out.splitlines()
+
+@pytest.mark.parametrize("mode", [
+    ["--all"],
+    ["--all", "--blocks"],
+    ["--exact", "3"],
+    ["--exact-y", "3"],
+    ["--range", "2", "4"],
+    ["--all", "--workers", "2"],
+])
+def test_limit_same_meaning_on_every_path(monkeypatch, capsys, mode):
+    # n=11 para que --all use el camino por lotes
+    for limit in ("0", "-3"):
+        assert run_cli(monkeypatch, capsys, "--n", "11", *mode, "--limit", limit) == []
+    lines = run_cli(monkeypatch, capsys, "--n", "11", *mode, "--limit", "3")
+    assert [int(ln.split(":")[0]) for ln in lines] == [1, 2, 3]
+
+def test_numba_formatter_matches_python_printer():
+    np = pytest.importorskip("numpy")
+    from cli._fmt_numba import format_rgs_batch, line_bound
+    from cli.main import make_rgs_printer
+    from combinatoria.rgs import rgs_all
+
+    for n in range(0, 8):
+        pairs = list(rgs_all(n, with_k=True))
+        rows = np.array([a for a, _ in pairs], dtype=np.int8).reshape(len(pairs), n)
+        rgs_line = make_rgs_printer(n)
+        # 1: contador de 5 columnas; 99990: el contador pasa a 6 dígitos en el lote
+        for start in (1, 99990, 123456):
+            text = np.empty(len(pairs) * line_bound(n), dtype=np.uint8)
+            nbytes = format_rgs_batch(rows, start, text)
+            expected = b"".join(rgs_line(start + i, a, k) for i, (a, k) in enumerate(pairs))
+            assert text[:nbytes].tobytes() == expected
+
+def test_printers_match_baseline_format():
+    from cli.main import format_blocks_from_rgs, make_rgs_printer
+    from combinatoria.rgs import rgs_all, rgs_to_blocks
+
+    for n in range(0, 7):
+        rgs_line = make_rgs_printer(n)
+        bufs = []
+        for c, (a, k) in enumerate(rgs_all(n, with_k=True), start=1):
+            # Formato original: print(f"{count:>5}: RGS={a}  (#bloques={k})")
+            assert rgs_line(c, a, k) == f"{c:>5}: RGS={a}  (#bloques={k})\n".encode()
+            blocks = " | ".join("{" + ",".join(map(str, b)) + "}" for b in rgs_to_blocks(a))
+            assert format_blocks_from_rgs(a, bufs) == blocks.encode()
+    assert make_rgs_printer(3)(1234567, [0, 1, 0], 2) == b"1234567: RGS=[0, 1, 0]  (#bloques=2)\n"
+
+@pytest.mark.parametrize("mode", [
+    ["--n", "4", "--exact", "2"],
+    ["--n", "4", "--all", "--blocks"],
+    ["--n", "4", "--all", "--sleep", "0.001", "--limit", "2"],
+    ["--n", "11", "--all", "--limit", "5"],
+    ["--n", "4", "--all", "--workers", "2"],
+])
+def test_text_only_stdout(monkeypatch, capsys, mode):
+    # stdout sin .buffer (p. ej. io.StringIO): mismas líneas que con stdout real
+    expected = run_cli(monkeypatch, capsys, *mode)
+    fake = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", fake)
+    monkeypatch.setattr(sys, "argv", ["main", *mode])
+    main()
+    assert fake.getvalue().splitlines() == expected != []
+
+def _body(line: str) -> str:
+    return line.split(": ", 1)[1]
+
+@pytest.mark.parametrize("mode", [
+    ["--all"],
+    ["--all", "--blocks"],
+    ["--range", "2", "4"],
+    ["--range", "1", "2", "--blocks"],
+])
+@pytest.mark.parametrize("limit", [[], ["--limit", "40"]])
+def test_workers_number_consecutively_and_match_sequential(monkeypatch, capsys, mode, limit):
+    n = "6"
+    seq = run_cli(monkeypatch, capsys, "--n", n, *mode)
+    par = run_cli(monkeypatch, capsys, "--n", n, *mode, *limit, "--workers", "3")
+    # Numeración global consecutiva
+    assert [int(ln.split(":")[0]) for ln in par] == list(range(1, len(par) + 1))
+    if not limit:
+        assert sorted(map(_body, par)) == sorted(map(_body, seq))
+    else:
+        # Agrupado por k: son las primeras 40 líneas del orden por número de bloques
+        by_k = sorted(seq, key=lambda ln: len(_body(ln).split(" | ")) if "--blocks" in mode
+                      else int(ln.rsplit("=", 1)[1].rstrip(")")))
+        assert len(par) == min(40, len(seq))
+        assert list(map(_body, par)) == list(map(_body, by_k))[: len(par)]
+
+@pytest.mark.parametrize("bad", [["--all", "--workers", "-1"], ["--exact", "2", "--workers", "2"],
+                                  ["--exact-y", "2", "--workers", "0"]])
+def test_workers_rejects_invalid_use(monkeypatch, capsys, bad):
+    with pytest.raises(SystemExit):
+        run_cli(monkeypatch, capsys, "--n", "4", *bad)
+
+@pytest.mark.parametrize("mode", [
+    ["--all"],
+    ["--exact", "2"],
+    ["--exact-y", "3"],
+    ["--range", "1", "3"],
+    ["--exact", "7"],
+    ["--exact-y", "7"],
+    ["--range", "3", "9"],
+    ["--range", "3", "1"],
+])
+def test_count_only_matches_enumeration(monkeypatch, capsys, mode):
+    listed = run_cli(monkeypatch, capsys, "--n", "5", *mode)
+    assert run_cli(monkeypatch, capsys, "--n", "5", *mode, "--count-only") == [str(len(listed))]
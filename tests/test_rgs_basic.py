@@ -1,6 +1,6 @@
 # tests/test_rgs_basic.py
 from typing import List
-from combinatoria.rgs import rgs_all, rgs_exactly, rgs_exactly_y, rgs_range, rgs_to_blocks
+from combinatoria.rgs import rgs_all, rgs_exactly, rgs_exactly_y, rgs_range, rgs_to_blocks, rgs_to_blocks_into
 
 def is_valid_rgs(a: List[int]) -> bool:
     """RGS válido: a[i] <= 1 + max(a[:i]) y etiquetas compactas 0..m."""
@@ -55,3 +55,25 @@ def test_range_covers_union_of_exactly():
         union.extend(list(rgs_exactly(n, k)))
     assert len(rng) == len(union)
     assert set(tuple(x) for x in rng) == set(tuple(x) for x in union)
+
+def test_with_k_reports_num_blocks():
+    n = 6
+    gens = [rgs_all(n, with_k=True), rgs_range(n, 1, n, with_k=True), rgs_range(n, 0, 3, with_k=True)]
+    gens += [rgs_exactly(n, k, with_k=True) for k in range(0, n + 1)]
+    gens += [rgs_exactly_y(n, k, with_k=True) for k in range(0, n + 1)]
+    for gen in gens:
+        for a, k in gen:
+            assert k == 1 + max(a)
+    assert list(rgs_all(0, with_k=True)) == [([], 0)]
+    assert list(rgs_exactly_y(4, 0)) == []
+
+def test_blocks_into_reuses_buffers():
+    n = 5
+    buffers = [[] for _ in range(n)]
+    ids = [id(b) for b in buffers]
+    for a in rgs_all(n):
+        blocks = rgs_to_blocks_into(a, buffers)
+        assert blocks == rgs_to_blocks(a)
+        assert is_valid_partition(blocks, n)
+    assert [id(b) for b in buffers] == ids
+    assert rgs_to_blocks([0, 1, 0, 2]) == [[1, 3], [2], [4]]
@@ -1,5 +1,7 @@
 # tests/test_rgs_consistency.py
-from combinatoria.rgs import rgs_all, rgs_exactly, rgs_range
+import pytest
+
+from combinatoria.rgs import rgs_all, rgs_all_batched, rgs_exactly, rgs_range
 
 def test_all_equals_union_of_exactly():
     n = 6
@@ -17,3 +19,27 @@ def test_range_vs_all_for_full_bounds():
     r = list(rgs_range(n, 1, n))
     v = list(rgs_all(n))
     assert set(tuple(a) for a in r) == set(tuple(a) for a in v)
+
+def test_numba_batch_matches_all():
+    np = pytest.importorskip("numpy")
+    from combinatoria._rgs_numba import new_state, rgs_all_batch
+    for n in range(1, 7):
+        a, b = new_state(n)
+        # Lote pequeño para forzar varias llamadas reanudando el estado
+        out = np.empty((7, n), dtype=np.int8)
+        rows = []
+        while True:
+            got = rgs_all_batch(n, a, b, out)
+            if got == 0:
+                break
+            rows.extend(out[:got].tolist())
+        assert rows == list(rgs_all(n))
+
+def test_batched_matches_all():
+    pytest.importorskip("numpy")
+    for n in range(0, 7):
+        rows = []
+        for arr in rgs_all_batched(n, batch=16):
+            assert arr.dtype.name == "int8" and arr.shape[1] == n
+            rows.extend(arr.tolist())
+        assert rows == list(rgs_all(n))
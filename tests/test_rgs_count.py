@@ -1,9 +1,10 @@
 # tests/test_rgs_counts.py
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from math import comb
-from collections import Counter
 
-from combinatoria.rgs import rgs_all, rgs_exactly
+import pytest
+
+from combinatoria.rgs import count_all, count_exactly, rgs_all, rgs_all_batched, rgs_exactly, rgs_range
 
 # Bell(n) por recurrencia clásica: B_{n+1} = sum_{k=0..n} C(n,k) B_k ; B_0=1
 def bell(n: int) -> int:
@@ -26,13 +27,21 @@ def stirling2(n: int, k: int) -> int:
             S[i][j] = j * S[i - 1][j] + S[i - 1][j - 1]
     return S[n][k]
 
-def count_by_num_blocks(rgss: List[List[int]]) -> Dict[int, int]:
-    # num_bloques = 1 + max(a), o 0 si a está vacío
-    c = Counter()
-    for a in rgss:
-        k = 0 if len(a) == 0 else (1 + max(a))
-        c[k] += 1
-    return dict(c)
+def count_by_num_blocks(rgss: List[Tuple[List[int], int]], n: int) -> Dict[int, int]:
+    # Pares (a, k) de los generadores con with_k=True: k ya es el nº de bloques
+    # y vive en [0, n], así que basta un arreglo denso en lugar de un Counter
+    counts = [0] * (n + 2)
+    for _, k in rgss:
+        counts[k] += 1
+    return {k: c for k, c in enumerate(counts) if c}
+
+def count_by_num_blocks_batched(n: int) -> Dict[int, int]:
+    # Igual que count_by_num_blocks, pero sobre las matrices np.int8 por lotes
+    np = pytest.importorskip("numpy")
+    total = np.zeros(n + 2, dtype=np.int64)
+    for arr in rgs_all_batched(n, batch=64):
+        total += np.bincount(arr.max(axis=1).astype(np.int64) + 1, minlength=n + 2)
+    return {k: int(c) for k, c in enumerate(total) if c}
 
 def test_bell_totals_small_n():
     # Valores de referencia: B0=1, B1=1, B2=2, B3=5, B4=15, B5=52, B6=203, B7=877
@@ -42,16 +51,46 @@ def test_bell_totals_small_n():
 
 def test_stirling_distribution_n5():
     n = 5
-    rgss = list(rgs_all(n))
-    byk = count_by_num_blocks(rgss)
+    rgss = list(rgs_all(n, with_k=True))
+    byk = count_by_num_blocks(rgss, n)
     # Esperado: S(5,k) = 1, 15, 25, 10, 1  (k=1..5)
     expected = {k: stirling2(n, k) for k in range(1, n + 1)}
     assert sum(byk.values()) == bell(n) == 52
     assert byk == expected
 
+def test_stirling_distribution_batched_n7():
+    n = 7
+    byk = count_by_num_blocks_batched(n)
+    assert byk == {k: stirling2(n, k) for k in range(1, n + 1)}
+    assert sum(byk.values()) == bell(n)
+
 def test_exactly_matches_stirling_for_range():
     n = 6
     for k in range(1, n + 1):
         got = len(list(rgs_exactly(n, k)))
         exp = stirling2(n, k)
         assert got == exp
+
+def test_exactly_edge_cases():
+    assert list(rgs_exactly(1, 1)) == [[0]]
+    assert list(rgs_exactly(4, 0)) == []
+    assert list(rgs_exactly(4, 4)) == [[0, 1, 2, 3]]
+    assert list(rgs_exactly(0, 0)) == [[]]
+
+def test_count_all_matches_bell():
+    for n in range(0, 26):
+        assert count_all(n) == bell(n)
+
+def test_count_exactly_matches_stirling():
+    for n in range(0, 16):
+        for k in range(0, n + 2):
+            assert count_exactly(n, k) == stirling2(n, k)
+    assert count_exactly(5, -1) == 0
+
+@pytest.mark.slow
+def test_counts_match_enumeration_larger_n():
+    n = 10
+    assert len(list(rgs_all(n))) == count_all(n) == 115975
+    for k in range(0, n + 1):
+        assert len(list(rgs_exactly(n, k))) == count_exactly(n, k)
+    assert len(list(rgs_range(n, 3, 6))) == sum(count_exactly(n, k) for k in range(3, 7))